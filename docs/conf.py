@@ -9,6 +9,8 @@
 
 import os
 import sys
+from importlib import import_module
+from pathlib import Path
 
 # -- Project information -----------------------------------------------------
 
@@ -122,7 +124,7 @@ version_schema = Schema('version',
                             'date': F(ref=True, indexers=[by_year, by_month]),
                         },
                         content=F(form=F.Forms.LINES),
-                        description_template=open('_templates/version.rst', 'r').read(),
+                        description_template=Path('_templates/version.rst').read_text(encoding='utf-8'),
                         reference_template='🏷️{{ title }}',
                         missing_reference_template='🏷️{{ title }}',
                         ambiguous_reference_template='🏷️{{ title }}')
@@ -136,7 +138,7 @@ confval_schema = Schema('confval',
                             'versionchanged': F(form=F.Forms.LINES),
                         },
                         content=F(),
-                        description_template=open('_templates/confval.rst', 'r').read(),
+                        description_template=Path('_templates/confval.rst').read_text(encoding='utf-8'),
                         reference_template='⚙️{{ title }}',
                         missing_reference_template='⚙️{{ title }}',
                         ambiguous_reference_template='⚙️{{ title }}')
@@ -144,7 +146,7 @@ example_schema = Schema('example',
                         name=F(ref=True),
                         attrs={'style': F()},
                         content=F(form=F.Forms.LINES),
-                        description_template=open('_templates/example.rst', 'r').read(),
+                        description_template=Path('_templates/example.rst').read_text(encoding='utf-8'),
                         reference_template='📝{{ title }}',
                         missing_reference_template='📝{{ title }}',
                         ambiguous_reference_template='📝{{ title }}')
@@ -154,9 +156,9 @@ any_schemas = [
     confval_schema,
     example_schema,
 
-    __import__("_schemas.cat").cat.cat,
-    __import__("_schemas.dog2").dog2.dog,
-    __import__("_schemas.tmplvar").tmplvar.tmplvar,
+    import_module('_schemas.cat').cat,
+    import_module('_schemas.dog2').dog,
+    import_module('_schemas.tmplvar').tmplvar,
 ]
 
 primary_domain = 'any'
@@ -10,6 +10,7 @@ Sphinx extension entrypoint.
 
 from __future__ import annotations
 from typing import TYPE_CHECKING
+from os import path
 from importlib.metadata import version
 
 from sphinx.util import logging
@@ -30,8 +31,14 @@ def _config_inited(app: Sphinx, config: Config) -> None:
     AnyDomain.name = config.any_domain_name
     AnyDomain.label = config.any_domain_name
 
+    if config.any_jinja_bytecode_cache:
+        TemplateEnvironment.instance().enable_bytecode_cache(
+            path.join(app.doctreedir, 'any-jinja-cache')
+        )
+
     # Add schema before registering domain
     for v in app.config.any_schemas:
+        v.compile_templates()
         AnyDomain.add_schema(v)
 
     app.add_domain(AnyDomain)
@@ -45,7 +52,15 @@ def setup(app: Sphinx):
 
     app.add_config_value('any_domain_name', 'any', 'env', types=str)
     app.add_config_value('any_schemas', [], 'env', types=list[Schema])
+    app.add_config_value('any_jinja_bytecode_cache', True, '', types=bool)
     app.connect('config-inited', _config_inited)
     app.connect('warn-missing-reference', warn_missing_reference)
 
-    return {'version': version('sphinxnotes.any')}
+    return {
+        'version': version('sphinxnotes.any'),
+        # Schemas are registered to AnyDomain when config-inited, before
+        # Sphinx forks the reading processes, domain data is merged by
+        # AnyDomain.merge_domaindata.
+        'parallel_read_safe': True,
+        'parallel_write_safe': True,
+    }
@@ -83,7 +83,7 @@ class AnyDirective(SphinxDirective):
             name=self.arguments[0] if self.arguments else None,
             attrs=self.options,
             # Convert docutils.statemachine.ViewList.data -> str
-            content='\n'.join(list(self.content.data)),
+            content='\n'.join(self.content.data),
         )
 
     def _setup_nodes(
@@ -124,13 +124,13 @@ class AnyDirective(SphinxDirective):
             self.state.document.note_explicit_target(ahrnode)
             # Note object by docu fields
             domain.note_object(
-                self.env.docname, ahrid, self.schema, obj
+                self.env.docname, ahrid, self.schema, obj, objid
             )  # FIXME: Cast to AnyDomain
 
-        # Parse description
-        nested_parse_with_titles(
-            self.state, StringList(self.schema.render_description(obj)), contnode
-        )
+        # Parse description, there is nothing to parse if it renders to blank
+        description = self.schema.render_description(obj)
+        if any(line.strip() for line in description):
+            nested_parse_with_titles(self.state, StringList(description), contnode)
 
     def _run_section(self, obj: Object) -> list[Node]:
         # Get the title of the "section" where the directive is located
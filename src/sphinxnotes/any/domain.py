@@ -54,13 +54,26 @@ class AnyDomain(Domain):
     _indices_for_reftype: dict[str, type[AnyIndex]] = {}
     #: AnyDomain specific: objtype -> Schema instance
     _schemas: dict[str, Schema] = {}
+    #: AnyDomain specific: reftype -> RefType instance
+    _reftypes: dict[str, RefType] = {}
 
     initial_data: dict[str, Any] = {
         # See property object
         'objects': {},
         # See property references
         'references': {},
+        # See property objects_by_doc
+        'objects_by_doc': {},
+        # See property references_by_object
+        'references_by_object': {},
     }
+    #: Bumped when the layout of :attr:`initial_data` is changed
+    data_version = 1
+
+    def __init__(self, env: BuildEnvironment) -> None:
+        super().__init__(env)
+        # (objtype, objid) -> (obj, rendered reference), see _render_reference
+        self._reference_titles: dict[tuple[str, str], tuple[Object, str]] = {}
 
     @property
     def objects(self) -> dict[tuple[str, str], tuple[str, str, Object]]:
@@ -72,38 +85,90 @@ class AnyDomain(Domain):
         """(objtype, objfield, objref) -> set(objid)"""
         return self.data.setdefault('references', {})
 
+    @property
+    def objects_by_doc(self) -> dict[str, set[tuple[str, str]]]:
+        """docname -> set((objtype, objid)), reverse index of :attr:`objects`"""
+        return self.data.setdefault('objects_by_doc', {})
+
+    @property
+    def references_by_object(
+        self,
+    ) -> dict[tuple[str, str], set[tuple[str, str, str]]]:
+        """(objtype, objid) -> set((objtype, objfield, objref)), reverse index of
+        :attr:`references`"""
+        return self.data.setdefault('references_by_object', {})
+
     def note_object(
-        self, docname: str, anchor: str, schema: Schema, obj: Object
+        self,
+        docname: str,
+        anchor: str,
+        schema: Schema,
+        obj: Object,
+        objid: str | None = None,
     ) -> None:
+        """
+        :param objid: Identifier of object, computed by ``schema`` if not given
+        """
         objtype = obj.objtype
-        _, objid = schema.identifier_of(obj)
+        if objid is None:
+            _, objid = schema.identifier_of(obj)
         objrefs = schema.references_of(obj)
-        if (objtype, objid) in self.objects:
-            other_docname, other_anchor, other_obj = self.objects[objtype, objid]
+        objkey = (objtype, objid)
+        other = self.objects.get(objkey)
+        if other is not None:
+            other_docname, other_anchor, other_obj = other
             logger.warning(
                 f'duplicate identifier of {obj} at {docname}#{anchor}'
                 + f'other object is {other_obj} at {other_docname}#{other_anchor}'
             )
         logger.debug(
-            f'[any] note object {objtype} {objid} at {docname}#{anchor}, references: {objrefs}'
+            '[any] note object %s %s at %s#%s, references: %s',
+            objtype,
+            objid,
+            docname,
+            anchor,
+            objrefs,
         )
-        self.objects[objtype, objid] = (docname, anchor, obj)
+        self.objects[objkey] = (docname, anchor, obj)
+        self.objects_by_doc.setdefault(docname, set()).add(objkey)
+        refkeys = self.references_by_object.setdefault(objkey, set())
+        references = self.references
         for objfield, objref in objrefs:
-            self.references.setdefault((objtype, objfield, objref), set()).add(objid)
+            refkey = (objtype, objfield, objref)
+            references.setdefault(refkey, set()).add(objid)
+            refkeys.add(refkey)
 
     # Override parent method
     def clear_doc(self, docname: str) -> None:
-        objids = set()
-        for (objtype, objid), (doc, _, _) in list(self.objects.items()):
-            if doc == docname:
-                del self.objects[objtype, objid]
-                objids.add(objid)
-        for (objtype, objfield, objref), ids in list(self.references.items()):
-            ids = ids - objids
-            if ids:
-                self.references[objtype, objfield, objref] = ids
-            else:
-                del self.references[objtype, objfield, objref]
+        for objtype, objid in self.objects_by_doc.pop(docname, ()):
+            doc, _, _ = self.objects.get((objtype, objid), (None, None, None))
+            if doc != docname:
+                continue  # object is overwritten by duplicated one in other doc
+            del self.objects[objtype, objid]
+            for refkey in self.references_by_object.pop((objtype, objid), ()):
+                ids = self.references.get(refkey)
+                if ids is None:
+                    continue
+                ids.discard(objid)
+                if not ids:
+                    del self.references[refkey]
+
+    # Override parent method
+    def merge_domaindata(self, docnames: list[str], otherdata: dict[str, Any]) -> None:
+        for docname in docnames:
+            objkeys = otherdata['objects_by_doc'].get(docname, set())
+            self.objects_by_doc.setdefault(docname, set()).update(objkeys)
+            for objtype, objid in objkeys:
+                entry = otherdata['objects'].get((objtype, objid))
+                if entry is None or entry[0] != docname:
+                    continue
+                self.objects[objtype, objid] = entry
+                refkeys = otherdata['references_by_object'].get((objtype, objid), ())
+                self.references_by_object.setdefault((objtype, objid), set()).update(
+                    refkeys
+                )
+                for refkey in refkeys:
+                    self.references.setdefault(refkey, set()).add(objid)
 
     # Override parent method
     def resolve_xref(
@@ -120,22 +185,28 @@ class AnyDomain(Domain):
 
         logger.debug('[any] resolveing xref of %s', (typ, target))
 
-        reftype = RefType.parse(typ)
+        reftype = self._reftypes.get(typ) or RefType.parse(typ)
         objtype, objfield, objidx = reftype.objtype, reftype.field, reftype.indexer
-        objids = set()
-        if objidx:
-            pass  # no need to lookup objds
-        if objfield:
-            # NOTE: To prevent change domain data, dont use ``objids = xxx``
-            ids = self.references.get((objtype, objfield, target))
-            if ids:
-                objids.update(ids)
-        else:
-            for (t, _, r), ids in self.references.items():
-                if t == objtype and r == target:
-                    objids.update(ids)
-
         schema = self._schemas[objtype]
+        objids: set[str] = set()
+        if objidx is None:  # no need to lookup objids when referencing index
+            if objfield:
+                objfields = (objfield,)
+            else:
+                # Reference by any referenceable field of the object.
+                objfields = schema.ref_field_names()
+            for name in objfields:
+                ids = self.references.get((objtype, name, target))
+                if not ids:
+                    continue
+                # NOTE: objids may be the set in domain data, never modify it
+                # in place, the usual single field match is used without copy.
+                objids = objids | ids if objids else ids
+            if not objids:
+                # The pending_xref node may be resolved by intersphinx,
+                # so do not emit warning here, see also warn_missing_reference.
+                return None
+
         title = contnode[0].astext()
         has_explicit_title = node['refexplicit']
         newtitle = None
@@ -147,20 +218,22 @@ class AnyDomain(Domain):
             if not has_explicit_title:
                 newtitle = schema.render_ambiguous_reference(title)
             logger.debug(
-                f'ambiguous {objtype} {target} in {self}, '
-                + f'ids: {objids} index: {todocname}#{anchor}'
+                'ambiguous %s %s in %s, ids: %s index: %s#%s',
+                objtype,
+                target,
+                self,
+                objids,
+                todocname,
+                anchor,
             )
-        elif len(objids) == 1:
-            todocname, anchor, obj = self.objects[objtype, objids.pop()]
-            if not has_explicit_title:
-                newtitle = schema.render_reference(obj)
         else:
-            # The pending_xref node may be resolved by intersphinx,
-            # so do not emit warning here, see also warn_missing_reference.
-            return None
+            objid = next(iter(objids))
+            todocname, anchor, obj = self.objects[objtype, objid]
+            if not has_explicit_title:
+                newtitle = self._render_reference(schema, objid, obj)
 
         if newtitle:
-            logger.debug(f'[any] rewrite title from {title} to {newtitle}')
+            logger.debug('[any] rewrite title from %s to %s', title, newtitle)
             contnode.replace(contnode[0], Text(newtitle))
 
         refnode = make_refnode(
@@ -176,6 +249,13 @@ class AnyDomain(Domain):
 
     @classmethod
     def add_schema(cls, schema: Schema) -> None:
+        if cls._schemas.get(schema.objtype) == schema:
+            # Identical schema has been added (for example, by previous
+            # Sphinx application in same process), reuse its directive, roles
+            # and indices rather than creating duplicated ones.
+            logger.debug('[any] skip duplicated schema %s', schema.objtype)
+            return
+
         # Add to schemas dict
         cls._schemas[schema.objtype] = schema
 
@@ -189,14 +269,15 @@ class AnyDomain(Domain):
                 innernodeclass=literal,
             )
             cls.roles[str(reftype)] = role
-            logger.debug(f'[any] make role {reftype} →  {type(role)}')
+            cls._reftypes[str(reftype)] = reftype
+            logger.debug('[any] make role %s →  %s', reftype, type(role))
 
         def mkindex(reftype: RefType, indexer: Indexer):
             """Create and register object index."""
             index = AnyIndex.derive(schema, reftype, indexer)
             cls.indices.append(index)
             cls._indices_for_reftype[str(reftype)] = index
-            logger.debug(f'[any] make index {reftype} →  {type(index)}')
+            logger.debug('[any] make index %s →  %s', reftype, type(index))
 
         # Create all-in-one role and index (do not distinguish reference fields).
         reftypes = [RefType(schema.objtype)]
@@ -227,6 +308,19 @@ class AnyDomain(Domain):
         # Generates directive for creating object.
         cls.directives[schema.objtype] = AnyDirective.derive(schema)
 
+    def _render_reference(self, schema: Schema, objid: str, obj: Object) -> str:
+        """
+        Render reference of object, the result is reused by subsequent
+        references to the same object.
+        """
+        cached = self._reference_titles.get((obj.objtype, objid))
+        # Object is immutable, a re-noted object is always a new instance
+        if cached is not None and cached[0] is obj:
+            return cached[1]
+        reference = schema.render_reference(obj)
+        self._reference_titles[obj.objtype, objid] = (obj, reference)
+        return reference
+
     def _get_index_anchor(self, reftype: str, refval: str) -> tuple[str, str]:
         """
         Return the docname and anchor name of index page. Can be used for ``make_refnode()``.
@@ -241,10 +335,10 @@ class AnyDomain(Domain):
 def warn_missing_reference(
     app: Sphinx, domain: Domain, node: pending_xref
 ) -> bool | None:
-    if domain and domain.name != AnyDomain.name:
+    if domain and not isinstance(domain, AnyDomain):
         return None
 
-    reftype = RefType.parse(node['reftype'])
+    reftype = AnyDomain._reftypes.get(node['reftype']) or RefType.parse(node['reftype'])
     target = node['reftarget']
 
     msg = f'undefined reftype {reftype}: {target}'
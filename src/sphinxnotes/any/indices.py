@@ -16,7 +16,7 @@ from docutils.parsers.rst import roles
 from sphinx.domains import Domain, Index, IndexEntry
 from sphinx.util import logging
 
-from .objects import Schema, Value, Indexer, Category, RefType
+from .objects import Schema, Object, Value, Indexer, Category, RefType
 
 logger = logging.getLogger(__name__)
 
@@ -73,13 +73,15 @@ class AnyIndex(Index):
         # Main category  →  Sub-Category →  Extra (for ordering objids) →  objids
         dualidx: dict[Category, dict[Category, dict[Category, set[str]]]] = {}
 
-        objrefs = sorted(self.domain.data['references'].items())
-        for (objtype, objfield, objref), objids in objrefs:
-            if objtype != self.reftype.objtype:
-                continue
-            if self.reftype.field and objfield != self.reftype.field:
-                continue
-
+        # Filter before sorting, references of other objtypes and fields are
+        # sorted by their own indices.
+        objtype, objfield = self.reftype.objtype, self.reftype.field
+        objrefs = sorted(
+            (k, v)
+            for k, v in self.domain.data['references'].items()
+            if k[0] == objtype and (not objfield or k[1] == objfield)
+        )
+        for (_, _, objref), objids in objrefs:
             # TODO: pass a real Value
             for category in self.indexer.classify(Value(objref)):
                 main = category.as_main()
@@ -94,11 +96,16 @@ class AnyIndex(Index):
                     ).update(objids)
 
         content: dict[Category, list[IndexEntry]] = {}  # category →  entries
+        # objid →  (name, desc), an object may be indexed by many categories,
+        # but its description only needs to be stripped once
+        objinfos: dict[str, tuple[str, str]] = {}
+        if docnames is not None:
+            docnames = set(docnames)  # for fast membership testing
         for main, entries in self._sort_by_category(singleidx):
             index_entries = content.setdefault(main, [])
             for main, objids in self._sort_by_category(entries):
                 for objid in objids:
-                    entry = self._generate_index_entry(objid, docnames, main)
+                    entry = self._generate_index_entry(objid, docnames, main, objinfos)
                     if entry is None:
                         continue
                     index_entries.append(entry)
@@ -109,7 +116,9 @@ class AnyIndex(Index):
                 index_entries.append(self._generate_subcategory_index_entry(sub))
                 for subentry, objids in self._sort_by_category(subentries):
                     for objid in objids:
-                        entry = self._generate_index_entry(objid, docnames, subentry)
+                        entry = self._generate_index_entry(
+                            objid, docnames, subentry, objinfos
+                        )
                         if entry is None:
                             continue
                         index_entries.append(entry)
@@ -123,14 +132,33 @@ class AnyIndex(Index):
         return sorted_content, False
 
     def _generate_index_entry(
-        self, objid: str, ignore_docnames: Iterable[str] | None, category: Category
+        self,
+        objid: str,
+        ignore_docnames: Iterable[str] | None,
+        category: Category,
+        objinfos: dict[str, tuple[str, str]],
     ) -> IndexEntry | None:
         docname, anchor, obj = self.domain.data['objects'][self.reftype.objtype, objid]
         if ignore_docnames and docname not in ignore_docnames:
             return None
-        name = self.schema.title_of(obj) or objid
+        if objid not in objinfos:
+            objinfos[objid] = self._generate_object_info(objid, obj)
+        name, desc = objinfos[objid]
         subtype = category.index_entry_subtype()
         extra = category.extra or ''
+        return IndexEntry(
+            name,  # the name of the index entry to be displayed
+            subtype,  # the sub-entry related type
+            docname,  # docname where the entry is located
+            anchor,  # anchor for the entry within docname
+            extra,  # extra info for the entry
+            '',  # qualifier for the description
+            desc,  # description for the entry
+        )
+
+    def _generate_object_info(self, objid: str, obj: Object) -> tuple[str, str]:
+        """Return (name, desc) of object for index entries."""
+        name = self.schema.title_of(obj) or objid
         objcont = self.schema.content_of(obj)
         if isinstance(objcont, str):
             desc = objcont
@@ -141,15 +169,7 @@ class AnyIndex(Index):
         desc = strip_rst_markups(desc)  # strip rst markups
         desc = ''.join([ln for ln in desc.split('\n') if ln.strip()])  # strip NEWLINE
         desc = desc[:50] + '…' if len(desc) > 50 else desc  # shorten
-        return IndexEntry(
-            name,  # the name of the index entry to be displayed
-            subtype,  # the sub-entry related type
-            docname,  # docname where the entry is located
-            anchor,  # anchor for the entry within docname
-            extra,  # extra info for the entry
-            '',  # qualifier for the description
-            desc,  # description for the entry
-        )
+        return name, desc
 
     def _generate_subcategory_index_entry(self, category: Category) -> IndexEntry:
         assert category.sub is not None
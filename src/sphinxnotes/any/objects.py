@@ -10,6 +10,7 @@ Object and schema implementations.
 
 from typing import Any, Iterable, Literal, TypeVar, Callable
 import dataclasses
+import operator
 import pickle
 import hashlib
 from abc import ABC, abstractmethod
@@ -178,7 +179,7 @@ class Object(object):
         return hashlib.sha1(pickle.dumps(self)).hexdigest()[:7]
 
 
-@dataclasses.dataclass
+@dataclasses.dataclass(frozen=True, slots=True)
 class Field(object):
     """
     Describes value constraint of field of Object.
@@ -226,6 +227,14 @@ class Field(object):
         return self.form.extract(rawval)
 
 
+#: (field name, field instance, getter of field's raw value from object)
+type _FieldLayout = tuple[str, Field, Callable[[Object], str | None]]
+
+
+def _attr_getter(key: str) -> Callable[[Object], str | None]:
+    return lambda obj: obj.attrs.get(key)
+
+
 class Schema(object):
     """
     Schema is used to describe objects, and be able to generate corresponding
@@ -242,6 +251,34 @@ class Schema(object):
     #: Template variable name of object title
     TITLE_KEY = 'title'
 
+    __slots__ = (
+        'objtype',
+        'name',
+        'attrs',
+        'content',
+        'description_template',
+        'reference_template',
+        'missing_reference_template',
+        'ambiguous_reference_template',
+        '_required_attrs',
+        '_field_layout',
+        '_uniq_fields',
+        '_ref_fields',
+        '_ref_field_names',
+    )
+
+    #: Attributes that make up pickled state of schema
+    _STATE = (
+        'objtype',
+        'name',
+        'attrs',
+        'content',
+        'description_template',
+        'reference_template',
+        'missing_reference_template',
+        'ambiguous_reference_template',
+    )
+
     # Object type
     objtype: str
 
@@ -289,6 +326,8 @@ class Schema(object):
         self.missing_reference_template = missing_reference_template
         self.ambiguous_reference_template = ambiguous_reference_template
 
+        self._init_derived()
+
         # Check attrs constraint
         has_unique = False
         all_fields = [self.name, self.content] + list(self.attrs.values())
@@ -300,6 +339,55 @@ class Schema(object):
             else:
                 has_unique = field.uniq
 
+    def _init_derived(self) -> None:
+        """
+        Compute attributes derived from fields, they are excluded from pickled
+        state, see :meth:`__getstate__`.
+        """
+        # Only required attributes need to be checked when generating object.
+        self._required_attrs = [k for k, f in self.attrs.items() if f.required]
+        # Fields are fixed, so the layout walked by fields_of is computed
+        # once: (field name, field instance, raw value getter of object).
+        layout: list[_FieldLayout] = [
+            (k, f, _attr_getter(k)) for k, f in self.attrs.items()
+        ]
+        if self.name is not None:
+            layout.insert(0, (self.NAME_KEY, self.name, operator.attrgetter('name')))
+        if self.content is not None:
+            layout.append(
+                (self.CONTENT_KEY, self.content, operator.attrgetter('content'))
+            )
+        self._field_layout = tuple(layout)
+        self._uniq_fields = tuple(x for x in layout if x[1].uniq)
+        self._ref_fields = tuple(x for x in layout if x[1].ref)
+        self._ref_field_names = tuple(x[0] for x in self._ref_fields)
+
+    def __getstate__(self) -> dict[str, Any]:
+        """
+        Only pickle the constructor arguments: Schema is compared by its
+        pickled bytes (see :meth:`__eq__`), derived attributes would make a
+        schema differ from its unpickled copy.
+        """
+        return {k: getattr(self, k) for k in self._STATE}
+
+    def __setstate__(self, state: dict[str, Any]) -> None:
+        for k, v in state.items():
+            setattr(self, k, v)
+        self._init_derived()
+
+    def compile_templates(self) -> None:
+        """
+        Compile templates in advance, so syntax errors are reported as soon
+        as possible, and the compiled templates are cached for rendering.
+        """
+        for tmpl in [
+            self.description_template,
+            self.reference_template,
+            self.missing_reference_template,
+            self.ambiguous_reference_template,
+        ]:
+            TemplateEnvironment.from_cached_string(tmpl)
+
     def fields(
         self, exclude_name: bool = False, exclude_content: bool = False
     ) -> list[tuple[str, Field]]:
@@ -318,15 +406,22 @@ class Schema(object):
             fields.insert(0, (self.NAME_KEY, self.name))
         return fields
 
+    def ref_field_names(self) -> tuple[str, ...]:
+        """Return names of all referenceable fields, including name and content."""
+        return self._ref_field_names
+
     def object(
         self, name: str | None, attrs: dict[str, str], content: str | None
     ) -> Object:
         """Generate a object"""
-        obj = Object(objtype=self.objtype, name=name, attrs=attrs, content=content)
-        for name, field, val in self.fields_of(obj):
-            if field.required and val is None:
-                raise ObjectError(f'field {name} is required')
-        return obj
+        if self.name and self.name.required and name is None:
+            raise ObjectError(f'field {self.NAME_KEY} is required')
+        for key in self._required_attrs:
+            if attrs.get(key) is None:
+                raise ObjectError(f'field {key} is required')
+        if self.content and self.content.required and content is None:
+            raise ObjectError(f'field {self.CONTENT_KEY} is required')
+        return Object(objtype=self.objtype, name=name, attrs=attrs, content=content)
 
     def fields_of(
         self, obj: Object
@@ -336,24 +431,8 @@ class Schema(object):
         -> Iterable[field_name, field_instance, field_value],
         while the field_value is string_value|string_list_value.
         """
-        if self.name:
-            yield (
-                self.NAME_KEY,
-                self.name,
-                self.name.value_of(obj.name).value,
-            )
-        for name, field in self.attrs.items():
-            yield (
-                name,
-                field,
-                field.value_of(obj.attrs.get(name)).value,
-            )
-        if self.content:
-            yield (
-                self.CONTENT_KEY,
-                self.content,
-                self.content.value_of(obj.content).value,
-            )
+        for name, field, getter in self._field_layout:
+            yield name, field, field.value_of(getter(obj)).value
 
     def name_of(self, obj: Object) -> None | str | list[str]:
         assert obj
@@ -377,9 +456,8 @@ class Schema(object):
         If there is not any unique field, return (None, obj.hexdigest()) instead.
         """
         assert obj
-        for name, field, val in self.fields_of(obj):
-            if not field.uniq:
-                continue
+        for name, field, getter in self._uniq_fields:
+            val = field.value_of(getter(obj)).value
             if val is None:
                 break
             elif isinstance(val, str):
@@ -407,17 +485,19 @@ class Schema(object):
     def references_of(self, obj: Object) -> set[tuple[str, str]]:
         """Return all references (referenceable fields) of object"""
         assert obj
-        refs = []
-        for name, field, val in self.fields_of(obj):
-            if not field.ref:
-                continue
+        refs = set()
+        for name, field, getter in self._ref_fields:
+            val = field.value_of(getter(obj)).value
             if val is None:
                 continue
             elif isinstance(val, str):
-                refs.append((name, val))
+                refs.add((name, val))
             elif isinstance(val, list):
-                refs += [(name, x.strip()) for x in val if x.strip() != '']
-        return set(refs)
+                for x in val:
+                    x = x.strip()
+                    if x != '':
+                        refs.add((name, x))
+        return refs
 
     def _context_without_object(self) -> dict[str, str | list[str]]:
         return {
@@ -427,31 +507,38 @@ class Schema(object):
     def _context_of(self, obj: Object) -> dict[str, str | list[str]]:
         context = self._context_without_object()
 
-        def set_if_not_none(key, val) -> None:
+        name = self.name_of(obj)
+        if name is not None:
+            context[self.NAME_KEY] = name
+            # Same as title_of, but reuse the extracted name.
+            if isinstance(name, str):
+                context[self.TITLE_KEY] = name
+            elif name:
+                context[self.TITLE_KEY] = name[0]
+        content = self.content_of(obj)
+        if content is not None:
+            context[self.CONTENT_KEY] = content
+        for key, field in self.attrs.items():
+            val = field.value_of(obj.attrs.get(key)).value
             if val is not None:
                 context[key] = val
 
-        set_if_not_none(self.NAME_KEY, self.name_of(obj))
-        set_if_not_none(self.TITLE_KEY, self.title_of(obj))
-        set_if_not_none(self.CONTENT_KEY, self.content_of(obj))
-        for key, val in self.attrs_of(obj).items():
-            set_if_not_none(key, val)
-
         return context
 
     def render_description(self, obj: Object) -> list[str]:
         assert obj
-        tmpl = TemplateEnvironment().from_string(self.description_template)
+        tmpl = TemplateEnvironment.from_cached_string(self.description_template)
         description = tmpl.render(self._context_of(obj))
         logger.debug(
-            '[any] render description template %s: %s'
-            % (self.description_template, description)
+            '[any] render description template %s: %s',
+            self.description_template,
+            description,
         )
-        return description.split('\n')
+        return description.splitlines()
 
     def render_reference(self, obj: Object) -> str:
         assert obj
-        tmpl = TemplateEnvironment().from_string(self.reference_template)
+        tmpl = TemplateEnvironment.from_cached_string(self.reference_template)
         reference = tmpl.render(self._context_of(obj))
         logger.debug(
             '[any] render references template %s: %s',
@@ -465,7 +552,7 @@ class Schema(object):
     ) -> str:
         context = self._context_without_object()
         context[self.TITLE_KEY] = explicit_title
-        tmpl = TemplateEnvironment().from_string(reference_template)
+        tmpl = TemplateEnvironment.from_cached_string(reference_template)
         reference = tmpl.render(context)
         logger.debug(
             '[any] render references template without object %s: %s',
@@ -526,21 +613,16 @@ class RefType(object):
         - by-<indexer>
         """
 
-        if '+' in reftype:
-            reftype, action = reftype.split('+', 1)
-            if action.startswith('by-'):
-                index = action[3:]
-            else:
-                raise ValueError(f'unknown action {action} in RefType {reftype}')
-        else:
+        reftype, plus, action = reftype.partition('+')
+        if not plus:
             index = None
-
-        if '.' in reftype:
-            objtype, field = reftype.split('.', 1)
+        elif action.startswith('by-'):
+            index = action[3:]
         else:
-            objtype, field = reftype, None
+            raise ValueError(f'unknown action {action} in RefType {reftype}')
 
-        return cls(objtype, field, index)
+        objtype, dot, field = reftype.partition('.')
+        return cls(objtype, field if dot else None, index)
 
     def __str__(self):
         """Used as role name and index name."""
@@ -10,9 +10,11 @@ Jinja template extensions for sphinxnotes.any.
 
 from __future__ import annotations
 import os
+import re
 from os import path
 import posixpath
 import shutil
+from functools import lru_cache
 
 from sphinx.util import logging
 from sphinx.util.osutil import ensuredir, relative_uri
@@ -20,10 +22,53 @@ from sphinx.application import Sphinx
 from sphinx.builders import Builder
 
 import jinja2
+from jinja2.defaults import DEFAULT_NAMESPACE
 from wand.image import Image
 
 logger = logging.getLogger(__name__)
 
+# Template that substitutes a single variable, such as "🐈{{ title }}".
+_SIMPLE_TEMPLATE = re.compile(r'([^{\r]*)\{\{\s*([A-Za-z_]\w*)\s*\}\}([^{\r]*)')
+# Names that are literals or globals rather than variables in Jinja expression.
+_JINJA_RESERVED = {'true', 'false', 'none', 'True', 'False', 'None', *DEFAULT_NAMESPACE}
+
+
+class SimpleTemplate(object):
+    """
+    Template that is static or only substitutes a single variable.
+
+    It renders the same output as the corresponding :class:`jinja2.Template`,
+    but is much cheaper as no Jinja machinery is involved.
+    """
+
+    def __init__(self, prefix: str, key: str | None, suffix: str):
+        self.prefix = prefix
+        self.key = key
+        self.suffix = suffix
+
+    @classmethod
+    def parse(cls, source: str) -> SimpleTemplate | None:
+        """Return None if source is not a simple template."""
+        if '\r' in source:
+            return None  # Jinja normalizes newlines
+        if all(x not in source for x in ['{{', '{%', '{#']):
+            # Static template, Jinja strips single trailing newline.
+            return cls(source.removesuffix('\n'), None, '')
+        if source.endswith('\n'):
+            return None
+        m = _SIMPLE_TEMPLATE.fullmatch(source)
+        if not m or m.group(2) in _JINJA_RESERVED:
+            return None
+        return cls(*m.groups())
+
+    def render(self, context: dict) -> str:
+        if self.key is None:
+            return self.prefix
+        if self.key not in context:
+            # Undefined variable is rendered as empty string, same as Jinja.
+            return self.prefix + self.suffix
+        return self.prefix + str(context[self.key]) + self.suffix
+
 
 class Environment(jinja2.Environment):
     _builder: Builder
@@ -34,6 +79,8 @@ class Environment(jinja2.Environment):
     _srcdir: str
     # Same to _srcdir, but relative to Sphinx's srcdir.
     _reldir: str
+    # Environment instance shared by all schemas, see :meth:`instance`.
+    _instance: Environment | None = None
 
     @classmethod
     def setup(cls, app: Sphinx):
@@ -70,8 +117,8 @@ class Environment(jinja2.Environment):
             os.remove(cls._srcdir)
             os.symlink(cls._outdir, cls._srcdir)
 
-        logger.debug(f'[any] srcdir: {cls._srcdir}')
-        logger.debug(f'[any] outdir: {cls._outdir}')
+        logger.debug('[any] srcdir: %s', cls._srcdir)
+        logger.debug('[any] outdir: %s', cls._outdir)
 
     @classmethod
     def _on_build_finished(cls, app: Sphinx, exception):
@@ -89,6 +136,47 @@ class Environment(jinja2.Environment):
         self.filters['install'] = self.install_filter
         # self.filters['watermark'] = self._watermark_filter
 
+    @classmethod
+    def instance(cls) -> Environment:
+        """
+        Return the environment instance shared by all schemas, so filters and
+        parsing state are only set up once per process.
+        """
+        if cls._instance is None:
+            cls._instance = cls()
+        return cls._instance
+
+    @classmethod
+    @lru_cache(maxsize=None)
+    def from_cached_string(cls, source: str) -> jinja2.Template | SimpleTemplate:
+        """
+        Compile template source to :class:`jinja2.Template`, or
+        :class:`SimpleTemplate` if possible.
+
+        Compiled templates are cached by their source, so templates with same
+        source are only compiled once and shared by all schemas.
+        """
+        if tmpl := SimpleTemplate.parse(source):
+            return tmpl
+        env = cls.instance()
+        bcc = env.bytecode_cache
+        if bcc is None:
+            return env.from_string(source)
+        # Same as jinja2.BaseLoader.load, but the template has no name.
+        bucket = bcc.get_bucket(env, source, None, source)
+        if bucket.code is None:
+            bucket.code = env.compile(source)
+            bcc.set_bucket(bucket)
+        return env.template_class.from_code(env, bucket.code, env.make_globals(None))
+
+    def enable_bytecode_cache(self, directory: str) -> None:
+        """
+        Persist bytecode of compiled templates to the given directory, so
+        templates are not parsed again in subsequent builds.
+        """
+        ensuredir(directory)
+        self.bytecode_cache = jinja2.FileSystemBytecodeCache(directory, 'any_%s.cache')
+
     def thumbnail_filter(self, imgfn: str) -> str:
         srcfn, outfn, relfn = self._get_src_out_rel(imgfn)
         if not self._is_outdated(outfn, srcfn):
@@ -170,7 +258,7 @@ class Environment(jinja2.Environment):
 
         # If target file not found, regard as outdated
         if not path.exists(target):
-            logger.debug(f'[any] {target} is outdated: not found')
+            logger.debug('[any] %s is outdated: not found', target)
             return True
 
         # Compare mtime
@@ -179,8 +267,10 @@ class Environment(jinja2.Environment):
             srcmtime = path.getmtime(src)
             outdated = srcmtime > targetmtime
             if outdated:
-                logger.debug(f'[any] {target} is outdated: {srcmtime} > {targetmtime}')
+                logger.debug(
+                    '[any] %s is outdated: %s > %s', target, srcmtime, targetmtime
+                )
         except Exception as e:
             outdated = True
-            logger.debug(f'[any] {target} is outdated: {e}')
+            logger.debug('[any] %s is outdated: %s', target, e)
         return outdated
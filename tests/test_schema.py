@@ -1,10 +1,12 @@
 import os
+import pickle
 import sys
 import unittest
 from textwrap import dedent
 
 sys.path.insert(0, os.path.abspath('./src/sphinxnotes'))
 from any.api import Schema, Field
+from any.objects import ObjectError, RefType
 
 
 class TestSchema(unittest.TestCase):
@@ -12,6 +14,26 @@ class TestSchema(unittest.TestCase):
         self.assertEqual(Schema('cat'), Schema('cat'))
         self.assertEqual(self.new_schema(), self.new_schema())
 
+    def test_pickle(self):
+        for schema in [Schema('cat'), self.new_schema()]:
+            self.assertEqual(pickle.loads(pickle.dumps(schema)), schema)
+
+    def test_required(self):
+        schema = self.new_schema()
+        schema.object(name='mimi', attrs={'id': '1'}, content=None)
+        with self.assertRaises(ObjectError):
+            schema.object(name='mimi', attrs={}, content=None)
+
+    def test_identifier_and_references(self):
+        schema = self.new_schema()
+        obj = schema.object(name='mimi\nnyan', attrs={'id': '1'}, content=None)
+        self.assertEqual(schema.identifier_of(obj), ('id', '1'))
+        self.assertEqual(
+            schema.references_of(obj), {('name', 'mimi'), ('name', 'nyan'), ('id', '1')}
+        )
+        self.assertEqual(Schema('cat', name=None).identifier_of(obj)[0], None)
+        self.assertEqual(schema.ref_field_names(), ('name', 'id'))
+
     def new_schema(self) -> Schema:
         return Schema(
             'cat',
@@ -40,5 +62,18 @@ class TestSchema(unittest.TestCase):
         )
 
 
+class TestRefType(unittest.TestCase):
+    def test_parse(self):
+        for reftype in ['cat', 'cat.name', 'cat+by-year', 'cat.name+by-year']:
+            self.assertEqual(str(RefType.parse(reftype)), reftype)
+        reftype = RefType.parse('cat.name+by-year')
+        self.assertEqual(reftype.objtype, 'cat')
+        self.assertEqual(reftype.field, 'name')
+        self.assertEqual(reftype.indexer, 'year')
+        self.assertIsNone(RefType.parse('cat').field)
+        with self.assertRaises(ValueError):
+            RefType.parse('cat.name+foo')
+
+
 if __name__ == '__main__':
     unittest.main()
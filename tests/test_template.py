@@ -0,0 +1,51 @@
+import os
+import sys
+import tempfile
+import unittest
+
+import jinja2
+
+sys.path.insert(0, os.path.abspath('./src/sphinxnotes'))
+from any.template import SimpleTemplate, Environment
+
+
+class TestSimpleTemplate(unittest.TestCase):
+    def test_parse(self):
+        self.assertIsNotNone(SimpleTemplate.parse('🐈{{ title }}'))
+        self.assertIsNotNone(SimpleTemplate.parse('{{title}}'))
+        self.assertIsNotNone(SimpleTemplate.parse('static\n'))
+        self.assertIsNone(SimpleTemplate.parse('{{ title }}\n'))
+        self.assertIsNone(SimpleTemplate.parse('{{ none }}'))
+        self.assertIsNone(SimpleTemplate.parse('{{ title|upper }}'))
+        self.assertIsNone(SimpleTemplate.parse("{{ '{{' }}{{ title }}{{ '}}' }}"))
+
+    def test_render_same_as_jinja(self):
+        for source in ['🐈{{ title }}', '{{ title }} }', 'static\n', '{ static }']:
+            for context in [{'title': 'Nyan'}, {'title': ['a', 'b']}, {}]:
+                self.assertEqual(
+                    SimpleTemplate.parse(source).render(context),
+                    jinja2.Template(source).render(context),
+                )
+
+
+class TestEnvironment(unittest.TestCase):
+    def test_bytecode_cache(self):
+        env = Environment.instance()
+        source = '{{ title|upper }} (bytecode cache)'
+        with tempfile.TemporaryDirectory() as tmpdir:
+            env.enable_bytecode_cache(tmpdir)
+            try:
+                tmpl = Environment.from_cached_string(source)
+                self.assertEqual(len(os.listdir(tmpdir)), 1)
+                # Load the bytecode from disk rather than in-memory cache.
+                Environment.from_cached_string.cache_clear()
+                self.assertEqual(
+                    Environment.from_cached_string(source).render(title='nyan'),
+                    tmpl.render(title='nyan'),
+                )
+            finally:
+                env.bytecode_cache = None
+
+
+if __name__ == '__main__':
+    unittest.main()